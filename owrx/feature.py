@@ -1,20 +1,51 @@
 import subprocess
-from functools import reduce
-from operator import and_
 import re
-from distutils.version import LooseVersion, StrictVersion
 import inspect
-from owrx.config.core import CoreConfig
-from owrx.config import Config
-import shlex
 import os
+import json
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
+import importlib
+import shutil
+import atexit
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+_version_regex = re.compile("^v?([0-9]+(\\.[0-9]+)*)")
+_wsjtx_version_regex = re.compile("^WSJT-X (.*)$")
+
+
+def _parse_version(version):
+    """
+    Parse the numeric release part of a version string into a comparable tuple, e.g. "2.6.1-rc3" becomes (2, 6, 1).
+    Trailing zeroes are dropped so that "0.19" and "0.19.0" compare equal.
+
+    Returns None if the string does not start with a version number.
+    """
+    matches = _version_regex.match(str(version).strip())
+    if matches is None:
+        return None
+    release = [int(part) for part in matches.group(1).split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
+
+def _version_at_least(version, required_version):
+    parsed = _parse_version(version)
+    return parsed is not None and parsed >= _parse_version(required_version)
+
+
+@lru_cache(maxsize=None)
+def _connector_regex(command):
+    return re.compile("^{} version (.*)$".format(re.escape(command)))
+
+
 class UnknownFeatureException(Exception):
     pass
 
@@ -26,26 +57,128 @@ class FeatureCache(object):
     def getSharedInstance():
         if FeatureCache.sharedInstance is None:
             FeatureCache.sharedInstance = FeatureCache()
+            # the debounce timer is a daemon thread, so write any pending changes before exiting
+            atexit.register(FeatureCache.sharedInstance.flush)
         return FeatureCache.sharedInstance
 
+    # results that depend on the runtime configuration must not survive a restart
+    volatile = ["codecserver_ambe"]
+
     def __init__(self):
         self.cache = {}
         self.cachetime = timedelta(hours=2)
+        self.lock = threading.Lock()
+        self.storeTimer = None
+        self._load()
 
-    def has(self, feature):
-        if feature not in self.cache:
-            return False
-        now = datetime.now()
-        if self.cache[feature]["valid_to"] < now:
+    @staticmethod
+    def _getCacheFile():
+        from owrx.config.core import CoreConfig
+
+        # not in the temporary directory: that is usually /tmp, where other users could plant a cache file
+        return "{data_directory}/feature_cache.json".format(data_directory=CoreConfig().get_data_directory())
+
+    def _isPersistent(self, feature, value):
+        # only successful requirement checks are stored: restarting after installing or upgrading a dependency needs
+        # to pick it up. internal values (e.g. version strings) stay in memory, they would survive an upgrade.
+        if feature.startswith("__") or feature in FeatureCache.volatile:
             return False
-        return True
+        return value is True
+
+    def _load(self):
+        try:
+            with open(FeatureCache._getCacheFile(), "r") as f:
+                stored = json.load(f)
+            now = datetime.now()
+            for feature, entry in stored.items():
+                # never trust an entry for longer than we would have cached it ourselves
+                valid_to = min(datetime.fromtimestamp(entry["valid_to"]), now + self.cachetime)
+                if valid_to < now or not self._isPersistent(feature, entry["value"]):
+                    continue
+                self.cache[feature] = {"value": entry["value"], "valid_to": valid_to}
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.exception("error while loading feature cache")
+
+    def _scheduleStore(self):
+        # debounce: a feature scan sets a lot of values in a short time, write them all at once
+        with self.lock:
+            if self.storeTimer is not None:
+                return
+            self.storeTimer = threading.Timer(1.0, self._store)
+            self.storeTimer.daemon = True
+            self.storeTimer.start()
+
+    def cancelStore(self):
+        with self.lock:
+            if self.storeTimer is None:
+                return False
+            self.storeTimer.cancel()
+            self.storeTimer = None
+            return True
+
+    def flush(self):
+        if self.cancelStore():
+            self._store()
+
+    def _store(self):
+        with self.lock:
+            # a direct call supersedes any pending debounced write
+            if self.storeTimer is not None:
+                self.storeTimer.cancel()
+                self.storeTimer = None
+            data = {
+                feature: {"value": entry["value"], "valid_to": entry["valid_to"].timestamp()}
+                for feature, entry in self.cache.items()
+                if self._isPersistent(feature, entry["value"])
+            }
+        try:
+            file = FeatureCache._getCacheFile()
+            # don't write directly to file to avoid corruption on exceptions
+            tmp_file = "{}.tmp".format(file)
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, file)
+        except Exception:
+            logger.exception("error while storing feature cache")
+
+    def has(self, feature):
+        with self.lock:
+            if feature not in self.cache:
+                return False
+            now = datetime.now()
+            if self.cache[feature]["valid_to"] < now:
+                return False
+            return True
 
     def get(self, feature):
-        return self.cache[feature]["value"]
+        with self.lock:
+            return self.cache[feature]["value"]
+
+    def set(self, feature, value, valid_to=None):
+        if valid_to is None:
+            valid_to = datetime.now() + self.cachetime
+        with self.lock:
+            self.cache[feature] = {"value": value, "valid_to": valid_to}
+        if self._isPersistent(feature, value):
+            self._scheduleStore()
+
+
+_owrx_connector_doc = """
+The [owrx_connector](https://github.com/jketterl/owrx_connector) offers direct interfacing between your
+hardware and OpenWebRX.
 
-    def set(self, feature, value):
-        valid_to = datetime.now() + self.cachetime
-        self.cache[feature] = {"value": value, "valid_to": valid_to}
+If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
+`owrx-connector`.
+""".strip()
+
+# descriptions shared by multiple requirements. unique descriptions stay in the docstring of their has_* method.
+_requirement_docs = {
+    "rtl_connector": _owrx_connector_doc,
+    "rtl_tcp_connector": _owrx_connector_doc,
+    "soapy_connector": _owrx_connector_doc,
+}
 
 
 class FeatureDetector(object):
@@ -95,27 +228,74 @@ class FeatureDetector(object):
         "mqtt": ["paho_mqtt"],
     }
 
+    _probe_env = None
+    # imported on first use, see has_codecserver_ambe()
+    _mbe_synthesizer = None
+    _probe_env_lock = threading.Lock()
+    _soapy_drivers_lock = threading.Lock()
+    _wsjtx_version_lock = threading.Lock()
+    _requirement_locks = {}
+    _requirement_locks_lock = threading.Lock()
+
+    # commands that report their version in the common "<command> version x.y.z" format
+    _connector_commands = ["rtl_connector", "rtl_tcp_connector", "soapy_connector", "sddc_connector", "runds_connector"]
+
+    # every requirement of every feature, each listed once
+    _requirements = frozenset(requirement for requirements in features.values() for requirement in requirements)
+
     def feature_availability(self):
-        return {name: self.is_available(name) for name in FeatureDetector.features}
+        available = self._requirement_availability()
+        return {
+            name: all(available[req] for req in requirements)
+            for name, requirements in FeatureDetector.features.items()
+        }
 
     def feature_report(self):
+        available = self._requirement_availability()
+
         def requirement_details(name):
-            available = self.has_requirement(name)
             return {
-                "available": available,
+                "available": available[name],
                 # as of now, features are always enabled as soon as they are available. this may change in the future.
-                "enabled": available,
+                "enabled": available[name],
                 "description": self.get_requirement_description(name),
             }
 
         def feature_details(name):
+            requirements = self.get_requirements(name)
             return {
-                "available": self.is_available(name),
-                "requirements": {name: requirement_details(name) for name in self.get_requirements(name)},
+                "available": all(available[req] for req in requirements),
+                "requirements": {name: requirement_details(name) for name in requirements},
             }
 
         return {name: feature_details(name) for name in FeatureDetector.features}
 
+    def _requirement_availability(self):
+        # evaluate every requirement exactly once, no matter how many features depend on it
+        requirements = FeatureDetector._requirements
+        self._prefetch_requirements(requirements)
+        return {req: self.has_requirement(req) for req in requirements}
+
+    @staticmethod
+    def _max_probe_workers():
+        return min(32, (os.cpu_count() or 1) * 2)
+
+    def _prefetch_requirements(self, requirements):
+        # most requirement checks are waiting for subprocesses, so we can run them concurrently.
+        cache = FeatureCache.getSharedInstance()
+        requirements = [req for req in requirements if not cache.has(req)]
+        if not requirements:
+            return
+        # a single pool for all probes, so that connector and requirement checks don't wait for each other.
+        # probes are timed, so don't start more of them at once than a small system can handle.
+        workers = min(self._max_probe_workers(), len(requirements) + len(self._connector_commands))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = self._batch_check_connectors(self._connector_commands, executor)
+            futures += [executor.submit(self.has_requirement, req) for req in requirements]
+            # consume the results to make sure exceptions are raised here
+            for future in futures:
+                future.result()
+
     def is_available(self, feature):
         return self.has_requirements(self.get_requirements(feature))
 
@@ -129,57 +309,105 @@ class FeatureDetector(object):
             raise UnknownFeatureException('Feature "{0}" is not known.'.format(feature))
 
     def has_requirements(self, requirements):
-        passed = True
-        for requirement in requirements:
-            passed = passed and self.has_requirement(requirement)
-        return passed
+        cache = FeatureCache.getSharedInstance()
+
+        # check requirements that are already known to be missing first, they don't need a probe to fail.
+        def known_failure(requirement):
+            return cache.has(requirement) and not cache.get(requirement)
+
+        return all(self.has_requirement(r) for r in sorted(requirements, key=known_failure, reverse=True))
+
+    @classmethod
+    def _get_requirement_methods(cls):
+        # scan the class for requirement checks only once; the result is stored on the class itself.
+        if "_requirement_methods" not in cls.__dict__:
+            methods = {}
+            descriptions = {}
+            for name in dir(cls):
+                if not name.startswith("has_"):
+                    continue
+                method = getattr(cls, name)
+                if not callable(method):
+                    continue
+                methods[name[4:]] = method
+                descriptions[name[4:]] = _requirement_docs.get(name[4:]) or inspect.getdoc(method)
+            cls._requirement_descriptions = descriptions
+            cls._requirement_methods = methods
+        return cls._requirement_methods
 
     def _get_requirement_method(self, requirement):
-        methodname = "has_" + requirement
-        if hasattr(self, methodname) and callable(getattr(self, methodname)):
-            return getattr(self, methodname)
-        return None
+        method = self._get_requirement_methods().get(requirement)
+        if method is None:
+            return None
+        return method.__get__(self, type(self))
 
     def has_requirement(self, requirement):
         cache = FeatureCache.getSharedInstance()
         if cache.has(requirement):
             return cache.get(requirement)
 
-        method = self._get_requirement_method(requirement)
-        result = False
-        if method is not None:
-            result = method()
-        else:
-            logger.error("detection of requirement {0} not implement. please fix in code!".format(requirement))
+        # requirements can be checked from multiple threads, make sure every check only runs once
+        with self._get_requirement_lock(requirement):
+            if cache.has(requirement):
+                return cache.get(requirement)
 
-        cache.set(requirement, result)
-        return result
+            method = self._get_requirement_method(requirement)
+            result = False
+            if method is not None:
+                result = method()
+            else:
+                logger.error("detection of requirement {0} not implement. please fix in code!".format(requirement))
 
-    def get_requirement_description(self, requirement):
-        return inspect.getdoc(self._get_requirement_method(requirement))
+            cache.set(requirement, result)
+            return result
 
-    def command_is_runnable(self, command, expected_result=None):
+    @classmethod
+    def _get_requirement_lock(cls, requirement):
+        with cls._requirement_locks_lock:
+            if requirement not in cls._requirement_locks:
+                cls._requirement_locks[requirement] = threading.Lock()
+            return cls._requirement_locks[requirement]
+
+    def get_requirement_description(self, requirement):
+        self._get_requirement_methods()
+        return type(self)._requirement_descriptions.get(requirement)
+
+    @classmethod
+    def _get_probe_env(cls):
+        with cls._probe_env_lock:
+            if cls._probe_env is None:
+                # prevent X11 programs from opening windows if called from a GUI shell
+                cls._probe_env = {k: v for k, v in os.environ.items() if k != "DISPLAY"}
+            return cls._probe_env
+
+    def _runnable(self, argv, expected_result=None, timeout=2.0):
+        from owrx.config.core import CoreConfig
+
+        # looking through $PATH is a lot cheaper than trying to start a command that doesn't exist
+        if shutil.which(argv[0]) is None:
+            return False
         tmp_dir = CoreConfig().get_temporary_directory()
-        cmd = shlex.split(command)
-        env = os.environ.copy()
-        # prevent X11 programs from opening windows if called from a GUI shell
-        env.pop("DISPLAY", None)
+        env = self._get_probe_env()
         try:
             process = subprocess.Popen(
-                cmd,
+                argv,
                 stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 cwd=tmp_dir,
                 env=env,
             )
-            while True:
-                try:
-                    rc = process.wait(10)
-                    break
-                except subprocess.TimeoutExpired:
-                    logger.warning("feature check command \"%s\" did not return after 10 seconds!", command)
-                    process.kill()
+            try:
+                rc = process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                logger.warning(
+                    "feature check command \"%s\" did not return after %s seconds, treated as unavailable",
+                    " ".join(argv),
+                    timeout,
+                )
+                process.kill()
+                process.wait()
+                return False
 
             if expected_result is None:
                 return rc != 32512
@@ -188,6 +416,28 @@ class FeatureDetector(object):
         except FileNotFoundError:
             return False
 
+    def _probe_python_module(self, modname, attrs, required_version):
+        """
+        Import a python module and check the version attributes given in attrs against the required version.
+
+        Returns a tuple of the overall result and the versions found. Unlike external commands, a python module
+        either imports or doesn't for the lifetime of the process, so the result is cached indefinitely.
+        """
+        cache = FeatureCache.getSharedInstance()
+        key = "__module_{}__".format(modname)
+        if cache.has(key):
+            return cache.get(key)
+
+        try:
+            module = importlib.import_module(modname)
+            versions = {attr: getattr(module, attr) for attr in attrs}
+            result = (all(_version_at_least(v, required_version) for v in versions.values()), versions)
+        except (ImportError, AttributeError):
+            result = (False, {})
+
+        cache.set(key, result, valid_to=datetime.max)
+        return result
+
     def has_csdr(self):
         """
         OpenWebRX uses the demodulator and pipeline tools provided by the
@@ -199,18 +449,8 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `python3-csdr`.
         """
-        required_version = LooseVersion("0.19.0")
-
-        try:
-            from pycsdr.modules import csdr_version
-            from pycsdr.modules import version as pycsdr_version
-
-            return (
-                LooseVersion(csdr_version) >= required_version and
-                LooseVersion(pycsdr_version) >= required_version
-            )
-        except ImportError:
-            return False
+        ok, _ = self._probe_python_module("pycsdr.modules", ["csdr_version", "version"], "0.19.0")
+        return ok
 
     def has_nmux(self):
         """
@@ -219,7 +459,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `nmux`.
         """
-        return self.command_is_runnable("nmux --help")
+        return self._runnable(("nmux", "--help"))
 
     def has_perseustest(self):
         """
@@ -229,7 +469,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `perseus-tools`.
         """
-        return self.command_is_runnable("perseustest -h")
+        return self._runnable(("perseustest", "-h"))
 
     def has_digiham(self):
         """
@@ -241,76 +481,100 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `python3-digiham`.
         """
-        required_version = LooseVersion("0.6")
+        ok, _ = self._probe_python_module("digiham.modules", ["digiham_version", "version"], "0.6")
+        return ok
 
-        try:
-            from digiham.modules import digiham_version as digiham_version
-            from digiham.modules import version as pydigiham_version
+    def _get_connector_version(self, command):
+        cache = FeatureCache.getSharedInstance()
+        key = "__connector_version_{}__".format(command)
+        if cache.has(key):
+            return cache.get(key)
+
+        # the batch and the connector requirement checks may ask for the same version concurrently
+        with self._get_requirement_lock(key):
+            if cache.has(key):
+                return cache.get(key)
+
+            version = None
+            try:
+                process = subprocess.Popen([command, "--version"], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE)
+                try:
+                    stdout, _ = process.communicate(timeout=2)
+                    matches = _connector_regex(command).match(stdout.decode().partition("\n")[0])
+                    if matches is not None:
+                        version = matches.group(1)
+                except subprocess.TimeoutExpired:
+                    logger.warning("feature check command \"%s --version\" did not return after 2 seconds!", command)
+                    process.kill()
+                    process.wait()
+                    process.stdout.close()
+            except FileNotFoundError:
+                pass
 
-            return (
-                LooseVersion(digiham_version) >= required_version
-                and LooseVersion(pydigiham_version) >= required_version
-            )
-        except ImportError:
-            return False
+            cache.set(key, version)
+            return version
 
-    def _check_connector(self, command, required_version):
-        owrx_connector_version_regex = re.compile("^{} version (.*)$".format(re.escape(command)))
+    def _batch_check_connectors(self, commands, executor):
+        cache = FeatureCache.getSharedInstance()
+        return [
+            executor.submit(self._get_connector_version, command)
+            for command in commands
+            if not cache.has("__connector_version_{}__".format(command))
+        ]
 
-        try:
-            process = subprocess.Popen([command, "--version"], stdout=subprocess.PIPE)
-            matches = owrx_connector_version_regex.match(process.stdout.readline().decode())
-            if matches is None:
-                return False
-            version = LooseVersion(matches.group(1))
-            process.wait(1)
-            return version >= required_version
-        except FileNotFoundError:
+    def _check_connector(self, command, required_version):
+        version = self._get_connector_version(command)
+        if version is None:
             return False
+        return _version_at_least(version, required_version)
 
     def _check_owrx_connector(self, command):
-        return self._check_connector(command, LooseVersion("0.7"))
+        return self._check_connector(command, "0.7")
 
     def has_rtl_connector(self):
-        """
-        The [owrx_connector](https://github.com/jketterl/owrx_connector) offers direct interfacing between your
-        hardware and OpenWebRX.
-
-        If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
-        `owrx-connector`.
-        """
         return self._check_owrx_connector("rtl_connector")
 
     def has_rtl_tcp_connector(self):
-        """
-        The [owrx_connector](https://github.com/jketterl/owrx_connector) offers direct interfacing between your
-        hardware and OpenWebRX.
-
-        If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
-        `owrx-connector`.
-        """
         return self._check_owrx_connector("rtl_tcp_connector")
 
     def has_soapy_connector(self):
-        """
-        The [owrx_connector](https://github.com/jketterl/owrx_connector) offers direct interfacing between your
-        hardware and OpenWebRX.
-
-        If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
-        `owrx-connector`.
-        """
         return self._check_owrx_connector("soapy_connector")
 
-    def _has_soapy_driver(self, driver):
-        try:
-            process = subprocess.Popen(["soapy_connector", "--listdrivers"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    @classmethod
+    def _get_soapy_drivers(cls):
+        cache = FeatureCache.getSharedInstance()
+        # all soapy driver checks share the same output, so make sure it's only requested once
+        with cls._soapy_drivers_lock:
+            if cache.has("__soapy_drivers__"):
+                return cache.get("__soapy_drivers__")
+
+            try:
+                process = subprocess.Popen(
+                    ["soapy_connector", "--listdrivers"],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
 
-            drivers = [line.decode().strip() for line in process.stdout]
-            process.wait(1)
+                try:
+                    # loading all soapy modules can take a while
+                    stdout, _ = process.communicate(timeout=10)
+                    drivers = frozenset(filter(None, (line.strip() for line in stdout.decode().splitlines())))
+                except subprocess.TimeoutExpired:
+                    logger.warning("soapy_connector --listdrivers did not return after 10 seconds!")
+                    process.kill()
+                    # don't read the rest of the output, a forked child could still be holding the pipe open
+                    process.wait()
+                    process.stdout.close()
+                    drivers = frozenset()
+            except FileNotFoundError:
+                drivers = frozenset()
 
-            return driver in drivers
-        except FileNotFoundError:
-            return False
+            cache.set("__soapy_drivers__", drivers)
+            return drivers
+
+    def _has_soapy_driver(self, driver):
+        return driver in self._get_soapy_drivers()
 
     def has_soapy_rtl_sdr(self):
         """
@@ -439,7 +703,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `m17-demod`.
         """
-        return self.command_is_runnable("m17-demod", 0)
+        return self._runnable(("m17-demod",), 0)
 
     def has_direwolf(self):
         """
@@ -448,7 +712,7 @@ class FeatureDetector(object):
 
         Debian and Ubuntu users should be able to install the package `direwolf` from their distribution.
         """
-        return self.command_is_runnable("direwolf --help")
+        return self._runnable(("direwolf", "--help"))
 
     def has_wsjtx(self):
         """
@@ -458,33 +722,53 @@ class FeatureDetector(object):
 
         Debian and Ubuntu users can also install the `wsjtx` package provided by the distribution.
         """
-        return reduce(and_, map(self.command_is_runnable, ["jt9", "wsprd"]), True)
+        return all(self._runnable((c,)) for c in ("jt9", "wsprd"))
 
-    def _has_wsjtx_version(self, required_version):
-        wsjt_version_regex = re.compile("^WSJT-X (.*)$")
+    def _wsjtx_version(self):
+        cache = FeatureCache.getSharedInstance()
+        # both wsjtx version checks need the same information, so make sure it's only requested once
+        with self._wsjtx_version_lock:
+            if cache.has("__wsjtx_version__"):
+                return cache.get("__wsjtx_version__")
+
+            version = None
+            try:
+                process = subprocess.Popen(
+                    ["wsjtx_app_version", "--version"], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE
+                )
+                try:
+                    stdout, _ = process.communicate(timeout=2)
+                    matches = _wsjtx_version_regex.match(stdout.decode().partition("\n")[0])
+                    if matches is not None:
+                        version = matches.group(1)
+                except subprocess.TimeoutExpired:
+                    logger.warning("wsjtx_app_version --version did not return after 2 seconds!")
+                    process.kill()
+                    process.wait()
+                    process.stdout.close()
+            except FileNotFoundError:
+                pass
 
-        try:
-            process = subprocess.Popen(["wsjtx_app_version", "--version"], stdout=subprocess.PIPE)
-            matches = wsjt_version_regex.match(process.stdout.readline().decode())
-            if matches is None:
-                return False
-            version = LooseVersion(matches.group(1))
-            process.wait(1)
-            return version >= required_version
-        except FileNotFoundError:
+            cache.set("__wsjtx_version__", version)
+            return version
+
+    def _has_wsjtx_version(self, required_version):
+        version = self._wsjtx_version()
+        if version is None:
             return False
+        return _version_at_least(version, required_version)
 
     def has_wsjtx_2_3(self):
         """
         Newer digital modes (e.g. FST4, FST4) require WSJT-X in at least version 2.3.
         """
-        return self.has_wsjtx() and self._has_wsjtx_version(LooseVersion("2.3"))
+        return self.has_requirement("wsjtx") and self._has_wsjtx_version("2.3")
 
     def has_wsjtx_2_4(self):
         """
         WSJT-X version 2.4 introduced the Q65 mode.
         """
-        return self.has_wsjtx() and self._has_wsjtx_version(LooseVersion("2.4"))
+        return self.has_requirement("wsjtx") and self._has_wsjtx_version("2.4")
 
     def has_msk144decoder(self):
         """
@@ -494,7 +778,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `msk144decoder`.
         """
-        return self.command_is_runnable("msk144decoder")
+        return self._runnable(("msk144decoder",))
 
     def has_js8(self):
         """
@@ -502,7 +786,7 @@ class FeatureDetector(object):
 
         Debian and Ubuntu users should be able to install the package `js8call` from their distribution.
         """
-        return self.command_is_runnable("js8")
+        return self._runnable(("js8",), timeout=10.0)
 
     def has_js8py(self):
         """
@@ -511,13 +795,8 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `python3-js8py`.
         """
-        required_version = StrictVersion("0.2")
-        try:
-            from js8py.version import strictversion
-
-            return strictversion >= required_version
-        except ImportError:
-            return False
+        ok, _ = self._probe_python_module("js8py.version", ["strictversion"], "0.2")
+        return ok
 
     def has_alsa(self):
         """
@@ -526,7 +805,7 @@ class FeatureDetector(object):
 
         Debian and Ubuntu users should be able to install the package `alsa-utils` from their distribution.
         """
-        return self.command_is_runnable("arecord --help")
+        return self._runnable(("arecord", "--help"))
 
     def has_rockprog(self):
         """
@@ -534,7 +813,7 @@ class FeatureDetector(object):
 
         You can find instructions and downloads [here](https://o28.sischa.net/fifisdr/trac/wiki/De%3Arockprog).
         """
-        return self.command_is_runnable("rockprog")
+        return self._runnable(("rockprog",))
 
     def has_freedv_rx(self):
         """
@@ -548,7 +827,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `codec2`.
         """
-        return self.command_is_runnable("freedv_rx")
+        return self._runnable(("freedv_rx",))
 
     def has_dream(self):
         """
@@ -560,7 +839,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `dream-headless`.
         """
-        return self.command_is_runnable("dream --help", 0)
+        return self._runnable(("dream", "--help"), 0, timeout=10.0)
 
     def has_sddc_connector(self):
         """
@@ -568,7 +847,7 @@ class FeatureDetector(object):
 
         You can find more information [here](https://github.com/jketterl/sddc_connector).
         """
-        return self._check_connector("sddc_connector", LooseVersion("0.1"))
+        return self._check_connector("sddc_connector", "0.1")
 
     def has_soapy_sddc(self):
         """
@@ -590,7 +869,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `hpsdrconnector`.
         """
-        return self.command_is_runnable("hpsdrconnector -h")
+        return self._runnable(("hpsdrconnector", "-h"))
 
     def has_runds_connector(self):
         """
@@ -600,7 +879,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `runds-connector`.
         """
-        return self._check_connector("runds_connector", LooseVersion("0.2"))
+        return self._check_connector("runds_connector", "0.2")
 
     def has_codecserver_ambe(self):
         """
@@ -612,15 +891,19 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `codecserver`.
         """
+        from owrx.config import Config
 
         config = Config.get()
         server = ""
         if "digital_voice_codecserver" in config:
             server = config["digital_voice_codecserver"]
         try:
-            from digiham.modules import MbeSynthesizer
+            if FeatureDetector._mbe_synthesizer is None:
+                from digiham.modules import MbeSynthesizer
 
-            return MbeSynthesizer.hasAmbe(server)
+                FeatureDetector._mbe_synthesizer = MbeSynthesizer
+
+            return FeatureDetector._mbe_synthesizer.hasAmbe(server)
         except ImportError:
             return False
         except ConnectionError:
@@ -644,7 +927,7 @@ class FeatureDetector(object):
         version you would like to use. You can use symbolic links or the
         [Debian alternatives system](https://wiki.debian.org/DebianAlternatives) to achieve this.
         """
-        return self.command_is_runnable("dump1090 --version")
+        return self._runnable(("dump1090", "--version"))
 
     def has_rtl_433(self):
         """
@@ -653,7 +936,7 @@ class FeatureDetector(object):
 
         Debian and Ubuntu users should be able to install the package `rtl-433` from their distribution.
         """
-        return self.command_is_runnable("rtl_433 -h")
+        return self._runnable(("rtl_433", "-h"))
 
     def has_dumphfdl(self):
         """
@@ -663,7 +946,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `dumphfdl`.
         """
-        return self.command_is_runnable("dumphfdl --version")
+        return self._runnable(("dumphfdl", "--version"))
 
     def has_dumpvdl2(self):
         """
@@ -673,7 +956,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `dumpvdl2`.
         """
-        return self.command_is_runnable("dumpvdl2 --version")
+        return self._runnable(("dumpvdl2", "--version"))
 
     def has_redsea(self):
         """
@@ -683,7 +966,7 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `redsea`.
         """
-        return self.command_is_runnable("redsea --version")
+        return self._runnable(("redsea", "--version"))
 
     def has_csdreti(self):
         """
@@ -694,18 +977,8 @@ class FeatureDetector(object):
         If you are using the OpenWebRX Debian or Ubuntu repository, you should be able to install the package
         `python3-csdr-eti`.
         """
-        required_version = LooseVersion("0.1")
-
-        try:
-            from csdreti.modules import csdreti_version
-            from csdreti.modules import version as pycsdreti_version
-
-            return (
-                LooseVersion(csdreti_version) >= required_version
-                and LooseVersion(pycsdreti_version) >= required_version
-            )
-        except ImportError:
-            return False
+        ok, _ = self._probe_python_module("csdreti.modules", ["csdreti_version", "version"], "0.1")
+        return ok
 
     def has_dablin(self):
         """
@@ -714,7 +987,7 @@ class FeatureDetector(object):
 
         Debian and Ubuntu users should be able to install the package `dablin` from their distribution.
         """
-        return self.command_is_runnable("dablin -h")
+        return self._runnable(("dablin", "-h"))
 
     def has_paho_mqtt(self):
         """
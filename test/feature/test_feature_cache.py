@@ -0,0 +1,117 @@
+from owrx.config.core import CoreConfig
+from owrx.feature import FeatureCache
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+import json
+import os
+
+
+class FeatureCacheTest(TestCase):
+    def setUp(self):
+        self.sharedConfig = CoreConfig.sharedConfig
+        self.tmpdir = TemporaryDirectory()
+        config_file = Path(self.tmpdir.name) / "openwebrx.conf"
+        with open(config_file, "w") as f:
+            f.write("[core]\ndata_directory = {0}\ntemporary_directory = {0}\n".format(self.tmpdir.name))
+        CoreConfig.load(config_file)
+        self.cache_file = os.path.join(self.tmpdir.name, "feature_cache.json")
+        self.caches = []
+
+    def tearDown(self):
+        # pending debounced writes must not run after the config has been restored
+        for cache in self.caches:
+            cache.cancelStore()
+        CoreConfig.sharedConfig = self.sharedConfig
+        self.tmpdir.cleanup()
+
+    def _createCache(self):
+        cache = FeatureCache()
+        self.caches.append(cache)
+        return cache
+
+    def _storeAndReload(self, cache):
+        cache._store()
+        return self._createCache()
+
+    def testStoresAndLoadsPositiveResults(self):
+        cache = self._createCache()
+        cache.set("nmux", True)
+        reloaded = self._storeAndReload(cache)
+        self.assertTrue(reloaded.has("nmux"))
+        self.assertTrue(reloaded.get("nmux"))
+
+    def testDoesNotStoreInternalValues(self):
+        # an outdated version must not survive an upgrade and restart
+        cache = self._createCache()
+        cache.set("__connector_version_rtl_connector__", "0.6.0")
+        cache.set("__wsjtx_version__", "2.2.2")
+        cache.set("rtl_connector", False)
+        reloaded = self._storeAndReload(cache)
+        self.assertFalse(reloaded.has("__connector_version_rtl_connector__"))
+        self.assertFalse(reloaded.has("__wsjtx_version__"))
+        self.assertFalse(reloaded.has("rtl_connector"))
+
+    def testDoesNotStoreNegativeResults(self):
+        cache = self._createCache()
+        cache.set("nmux", False)
+        cache.set("__connector_version_rtl_connector__", None)
+        reloaded = self._storeAndReload(cache)
+        self.assertFalse(reloaded.has("nmux"))
+        self.assertFalse(reloaded.has("__connector_version_rtl_connector__"))
+
+    def testDoesNotStoreVolatileResults(self):
+        cache = self._createCache()
+        cache.set("codecserver_ambe", True)
+        reloaded = self._storeAndReload(cache)
+        self.assertFalse(reloaded.has("codecserver_ambe"))
+
+    def testDoesNotStoreNonJsonValues(self):
+        cache = self._createCache()
+        cache.set("__soapy_drivers__", frozenset(["rtlsdr"]))
+        cache.set("__module_pycsdr.modules__", (True, {}), valid_to=datetime.max)
+        reloaded = self._storeAndReload(cache)
+        self.assertFalse(reloaded.has("__soapy_drivers__"))
+        self.assertFalse(reloaded.has("__module_pycsdr.modules__"))
+
+    def testDropsExpiredEntriesOnLoad(self):
+        cache = self._createCache()
+        cache.set("nmux", True, valid_to=datetime.now() - timedelta(minutes=1))
+        cache.set("direwolf", True)
+        cache._store()
+        with open(self.cache_file, "r") as f:
+            self.assertIn("nmux", json.load(f))
+        reloaded = self._createCache()
+        self.assertNotIn("nmux", reloaded.cache)
+        self.assertTrue(reloaded.has("direwolf"))
+
+    def testLimitsValidityOfLoadedEntries(self):
+        with open(self.cache_file, "w") as f:
+            json.dump(
+                {
+                    "nmux": {"value": True, "valid_to": (datetime.now() + timedelta(days=365)).timestamp()},
+                    "direwolf": {"value": "yes", "valid_to": (datetime.now() + timedelta(hours=1)).timestamp()},
+                },
+                f,
+            )
+        cache = self._createCache()
+        self.assertTrue(cache.has("nmux"))
+        self.assertLessEqual(cache.cache["nmux"]["valid_to"], datetime.now() + cache.cachetime)
+        self.assertFalse(cache.has("direwolf"))
+
+    def testFlushWritesPendingChanges(self):
+        cache = self._createCache()
+        cache.set("nmux", True)
+        self.assertIsNotNone(cache.storeTimer)
+        cache.flush()
+        self.assertIsNone(cache.storeTimer)
+        with open(self.cache_file, "r") as f:
+            self.assertIn("nmux", json.load(f))
+
+    def testIgnoresCorruptCacheFile(self):
+        with open(self.cache_file, "w") as f:
+            f.write("not json")
+        with self.assertLogs("owrx.feature"):
+            cache = self._createCache()
+        self.assertEqual(cache.cache, {})
@@ -0,0 +1,40 @@
+from owrx.feature import _parse_version, _version_at_least
+from unittest import TestCase
+
+
+class StrictVersionLike(object):
+    def __init__(self, version):
+        self.version = version
+
+    def __str__(self):
+        return self.version
+
+
+class VersionTest(TestCase):
+    def testTrailingZeroesAreIgnored(self):
+        self.assertEqual(_parse_version("0.19"), _parse_version("0.19.0"))
+        self.assertTrue(_version_at_least("0.19", "0.19.0"))
+        self.assertTrue(_version_at_least("0.19.0", "0.19"))
+
+    def testVersionPrefix(self):
+        self.assertEqual(_parse_version("v0.7"), (0, 7))
+        self.assertTrue(_version_at_least("v0.7", "0.7"))
+        self.assertFalse(_version_at_least("v0.6.1", "0.7"))
+
+    def testSuffixIsIgnored(self):
+        self.assertEqual(_parse_version("2.6.1-rc3"), (2, 6, 1))
+        self.assertTrue(_version_at_least("2.6.1-rc3", "2.4"))
+        self.assertFalse(_version_at_least("2.2.2-rc1", "2.3"))
+
+    def testNumericComparison(self):
+        self.assertTrue(_version_at_least("0.10", "0.9"))
+        self.assertFalse(_version_at_least("0.9", "0.10"))
+
+    def testUnparseableVersion(self):
+        self.assertIsNone(_parse_version("unknown"))
+        self.assertIsNone(_parse_version(""))
+        self.assertFalse(_version_at_least("unknown", "0.1"))
+
+    def testStrictVersionObject(self):
+        self.assertTrue(_version_at_least(StrictVersionLike("0.2"), "0.2"))
+        self.assertFalse(_version_at_least(StrictVersionLike("0.1.5"), "0.2"))